@@ -14,16 +14,22 @@ from typing import (
     Union,
     Any,
     Iterator,
+    Iterable,
 )
+from collections.abc import MutableSequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 import logging
+import math
 import os
+import numpy as np
 from rootflow import __location__ as ROOTFLOW_LOCATION
 from rootflow.datasets.base.functional import FunctionalDataset
 from rootflow.datasets.base.utils import (
     batch_enumerate,
-    map_functions,
-    get_unique,
+    get_unique_indices,
     infer_task_from_targets,
+    to_object_array,
 )
 
 
@@ -49,6 +55,10 @@ class RootflowDataset(FunctionalDataset):
     :meth:`prepare_data`. If you wish to dynamically download the dataset, then the
     :meth:`download` method should also be implemented. For any additional steps which
     your dataset needs to perform, you may also implement the :meth:`setup` method.
+
+    Internally the data items are stored column-wise, as three parallel object arrays
+    of ids, data and targets. The :attr:`data` attribute still accepts and exposes
+    :class:`RootflowDataItem`s, which are created on demand from the columns.
     """
 
     def __init__(
@@ -123,6 +133,32 @@ class RootflowDataset(FunctionalDataset):
             logging.info(f"Tasks not specified, setting automatically")
         self._tasks = tasks
 
+    @property
+    def data(self) -> "RootflowDataItemSequence":
+        """RootflowDataItemSequence: The data items of the dataset.
+
+        Setting this attribute with a list of :class:`RootflowDataItem`s will replace
+        the contents of the dataset. The sequence also supports the list mutators
+        (``append``, ``extend``, ``insert``, ``del``, ...), and the items it returns
+        write any changes to their attributes through to the dataset.
+        """
+        return RootflowDataItemSequence(self)
+
+    @data.setter
+    def data(self, data_items: Sequence["RootflowDataItem"]) -> None:
+        if (
+            isinstance(data_items, RootflowDataItemSequence)
+            and data_items.dataset is self
+        ):
+            # Already written in place, e.g. by ``self.data += items``
+            return
+        ids, data, targets = [], [], []
+        for item_id, item_data, item_target in data_items:
+            ids.append(item_id)
+            data.append(item_data)
+            targets.append(item_target)
+        self._ids, self._data, self._targets = ids, data, targets
+
     def prepare_data(self, directory: str) -> List["RootflowDataItem"]:
         """Prepares data for a rootflow dataset.
 
@@ -167,46 +203,34 @@ class RootflowDataset(FunctionalDataset):
 
     def _infer_tasks(self):
         """Splits targets and infers task information"""
-        example_targets = self.index(0)[2]
+        targets = self._get_column(targets=True)
+        example_targets = targets[0]
         if example_targets is None:
             return None
         if isinstance(example_targets, Mapping):
             tasks = []
-
-            def multitask_generator(task_name):
-                for item in self:
-                    yield item["target"][task_name]
-
             for task_name in example_targets.keys():
-                generator = multitask_generator(task_name)
-                task_type, task_shape = infer_task_from_targets(generator)
+                task_targets = (target[task_name] for target in targets)
+                task_type, task_shape = infer_task_from_targets(task_targets)
                 tasks.append(
                     {"name": task_name, "type": task_type, "shape": task_shape}
                 )
             return tasks
         else:
-
-            def single_task_generator():
-                for item in self:
-                    yield item["target"]
-
-            task_type, task_shape = infer_task_from_targets(single_task_generator())
+            task_type, task_shape = infer_task_from_targets(iter(targets))
             return [{"name": "task", "type": task_type, "shape": task_shape}]
 
     # TODO: Decide how to handle map edge cases
     # Represents some dangerous interior mutability
     # Does not play well with views (What should we change and not change. Do we allow different parts of the dataset to have different data?)
     # Does not play well with datasets who need to have data be memmaped or hdf5ed from disk
-
-    # While splitting out the dataset into three lists, (ids, data, targets) might
-    # make batch mapping faster because we can do true slice assignment, it may also
-    # decrease the load speed for indexing the dataset (cache locality of the different
-    # item members for the given index) TODO: Test this
     def map(
         self,
         function: Union[Callable, List[Callable]],
         targets: bool = False,
         batch_size: int = None,
+        num_workers: int = 0,
+        use_threads: bool = False,
     ) -> Union["RootflowDataset", "RootflowDatasetView"]:
         """Maps a function over the dataset.
 
@@ -214,6 +238,12 @@ class RootflowDataset(FunctionalDataset):
         dataset. Returns `self` to assist with the functional API, but mutates internal
         state so is not functional at all.
 
+        If `num_workers` is greater than 0, the dataset is split into that many
+        contiguous chunks, which are mapped in parallel. By default each chunk is
+        mapped in a separate process, in which case the function must be picklable
+        (i.e. not a lambda). For functions which release the GIL, such as most numpy
+        operations or I/O, threads may be used instead.
+
         Args:
             function (Union[Callable, List[Callable]]): The function or functions you
                 would like to map over the dataset.
@@ -221,6 +251,10 @@ class RootflowDataset(FunctionalDataset):
                 over the data item targets, instead of the data.
             batch_size (:obj:`int`, optional): A batch size, if the functions to map
                 support or require batches of inputs.
+            num_workers (:obj:`int`, optional): The number of parallel workers to map
+                with. If 0, the function is mapped in the current process.
+            use_threads (:obj:`bool`, optional): Whether the parallel workers should be
+                threads instead of processes.
 
         Raises:
             AssertionError: If a batched function does not return a list of the same
@@ -231,37 +265,63 @@ class RootflowDataset(FunctionalDataset):
         ), f"Cannot use a value of type {type(function)} to map over dataset. Parameter `function` must be a callable object."
 
         if targets:
-            attribute = "target"
-        else:
-            attribute = "data"
-
-        if batch_size is None:
-            for idx, data_item in enumerate(self.data):
-                setattr(data_item, attribute, function(getattr(data_item, attribute)))
-                self.data[idx] = data_item
+            column = self._targets
         else:
-            for slice, batch in batch_enumerate(self.data, batch_size):
-                mapped_batch_data = function(
-                    [getattr(data_item, attribute) for data_item in batch]
+            column = self._data
+
+        if num_workers > 0:
+            # Chunks are aligned to the batch size so that batches do not change
+            chunk_batch_size = batch_size or 1
+            num_batches = math.ceil(len(column) / chunk_batch_size)
+            chunk_size = max(1, math.ceil(num_batches / num_workers)) * chunk_batch_size
+            slices, chunks = [], []
+            for slice, chunk in batch_enumerate(column, chunk_size):
+                slices.append(slice)
+                chunks.append(chunk)
+            if use_threads:
+                executor_type = ThreadPoolExecutor
+            else:
+                executor_type = ProcessPoolExecutor
+            with executor_type(max_workers=num_workers) as executor:
+                mapped_chunks = list(
+                    executor.map(
+                        _map_values, repeat(function), chunks, repeat(batch_size)
+                    )
                 )
-                assert isinstance(mapped_batch_data, Sequence) and not isinstance(
-                    mapped_batch_data, str
-                ), f"Map function {function.__name__} does not return a sequence over batch"
-                assert len(mapped_batch_data) == len(
-                    batch
-                ), f"Map function {function.__name__} does not return batch of same length as input"
-                for idx, mapped_example_data in zip(
-                    range(slice.start, slice.stop), mapped_batch_data
-                ):
-                    data_item = self.data[idx]
-                    setattr(data_item, attribute, mapped_example_data)
-                    self.data[idx] = data_item
+            for slice, mapped_chunk in zip(slices, mapped_chunks):
+                column[slice] = mapped_chunk
+        elif batch_size is None:
+            for idx in range(len(column)):
+                column[idx] = function(column[idx])
+        else:
+            for slice, batch in batch_enumerate(column, batch_size):
+                column[slice] = _map_batch(function, batch)
 
         return self
 
     def __len__(self) -> int:
         """Gets the length of the dataset."""
-        return len(self.data)
+        return len(self._ids)
+
+    def _get_column(self, targets: bool = False) -> np.ndarray:
+        """Returns the data, or targets, of every item as an object array"""
+        has_transforms = (
+            self.has_target_transforms if targets else self.has_data_transforms
+        )
+        if has_transforms or type(self).index is not RootflowDataset.index:
+            return super()._get_column(targets)
+        column = self._targets if targets else self._data
+        return to_object_array(column, len(column))
+
+    def _get_column_at(self, indices: np.ndarray, targets: bool = False) -> np.ndarray:
+        """Returns the data, or targets, of the items at the indices as an object array"""
+        if type(self).index is not RootflowDataset.index:
+            return super()._get_column_at(indices, targets)
+        column = self._targets if targets else self._data
+        column = to_object_array(
+            map(column.__getitem__, indices.tolist()), len(indices)
+        )
+        return self._transform_column(column, targets)
 
     def index(self, index: int) -> tuple:
         """Gets a single data example
@@ -277,17 +337,39 @@ class RootflowDataset(FunctionalDataset):
             tuple: A tuple of three items, respectively, the id of the data item, the
                 data content of the item, and the target of the data item.
         """
-        data_item = self.data[index]
-        id, data, target = data_item.id, data_item.data, data_item.target
+        id, data, target = self._ids[index], self._data[index], self._targets[index]
         if id is None:
             id = f"{type(self).__name__}-{index}"
         if self.has_data_transforms:
-            data = map_functions(data, self.data_transforms)
+            data = self._data_pipeline(data)
         if self.has_target_transforms:
-            target = map_functions(target, self.target_transforms)
+            target = self._target_pipeline(target)
         return (id, data, target)
 
 
+def _map_values(function: Callable, values: list, batch_size: int = None) -> list:
+    """Maps a function over a list of values, optionally in batches"""
+    if batch_size is None:
+        return [function(value) for value in values]
+
+    mapped_values = []
+    for _, batch in batch_enumerate(values, batch_size):
+        mapped_values.extend(_map_batch(function, batch))
+    return mapped_values
+
+
+def _map_batch(function: Callable, batch: list) -> Sequence:
+    """Maps a function over a single batch, checking the shape of its output"""
+    mapped_batch_data = function(batch)
+    assert isinstance(mapped_batch_data, Sequence) and not isinstance(
+        mapped_batch_data, str
+    ), f"Map function {function.__name__} does not return a sequence over batch"
+    assert len(mapped_batch_data) == len(
+        batch
+    ), f"Map function {function.__name__} does not return batch of same length as input"
+    return mapped_batch_data
+
+
 # TODO Add custom getattr for the dataset views so that if there is a custom
 # attribute on a dataset, a view of that dataset will have the same attribute
 class RootflowDatasetView(FunctionalDataset):
@@ -302,22 +384,23 @@ class RootflowDatasetView(FunctionalDataset):
     def __init__(
         self,
         dataset: FunctionalDataset,
-        view_indices: List[int],
+        view_indices: Union[List[int], np.ndarray],
         sorted: bool = True,
     ) -> None:
         """Creates an new view of a dataset.
 
         Args:
             dataset (FunctionalDataset): The dataset which we are taking a view of.
-            view_indices (List[int]): Indices corresponding to which data items from
-                the dataset we would like to include in the view.
+            view_indices (Union[List[int], np.ndarray]): Indices corresponding to
+                which data items from the dataset we would like to include in the view.
             sorted (:obj:`bool`, optional): Wether to sort the indices so that the
                 view maintains ordering when iterating.
         """
         super().__init__()
         self.dataset = dataset
-        unique_indices = get_unique(view_indices, ordered=sorted)
-        self.data_indices = unique_indices
+        # An int64 array takes 8 bytes per index, against about 36 for a list of
+        # ints, at the cost of slightly slower per-item lookups in index()
+        self.data_indices = get_unique_indices(view_indices, ordered=sorted)
 
     def tasks(self) -> List[dict]:
         """Returns a list of dataset tasks.
@@ -335,13 +418,27 @@ class RootflowDatasetView(FunctionalDataset):
         """
         return self.dataset.tasks()
 
-    def map(self, function: Callable, targets: bool = False, batch_size: int = None):
+    def map(
+        self,
+        function: Callable,
+        targets: bool = False,
+        batch_size: int = None,
+        num_workers: int = 0,
+        use_threads: bool = False,
+    ):
         raise AttributeError("Cannot map over a dataset view!")
 
     def __len__(self):
         """Returns the length of the view"""
         return len(self.data_indices)
 
+    def _get_column_at(self, indices: np.ndarray, targets: bool = False) -> np.ndarray:
+        """Returns the data, or targets, of the items at the indices as an object array"""
+        if type(self).index is not RootflowDatasetView.index:
+            return super()._get_column_at(indices, targets)
+        column = self.dataset._get_column_at(self.data_indices[indices], targets)
+        return self._transform_column(column, targets)
+
     def index(self, index):
         """Gets a single data example.
 
@@ -356,11 +453,11 @@ class RootflowDatasetView(FunctionalDataset):
             tuple: A tuple of three items, respectively, the id of the data item, the
                 data content of the item, and the target of the data item.
         """
-        id, data, target = self.dataset.index(self.data_indices[index])
+        id, data, target = self.dataset.index(self.data_indices.item(index))
         if self.has_data_transforms:
-            data = map_functions(data, self.data_transforms)
+            data = self._data_pipeline(data)
         if self.has_target_transforms:
-            target = map_functions(target, self.target_transforms)
+            target = self._target_pipeline(target)
         return (id, data, target)
 
 
@@ -461,13 +558,34 @@ class ConcatRootflowDatasetView(FunctionalDataset):
                 tasks.append(task)
         return tasks
 
-    def map(self, function: Callable, targets: bool = False, batch_size: int = None):
+    def map(
+        self,
+        function: Callable,
+        targets: bool = False,
+        batch_size: int = None,
+        num_workers: int = 0,
+        use_threads: bool = False,
+    ):
         raise AttributeError("Cannot map over concatenated datasets!")
 
     def __len__(self):
         """Returns the total length of the concatenated datasets."""
         return len(self.dataset_one) + len(self.dataset_two)
 
+    def _get_column_at(self, indices: np.ndarray, targets: bool = False) -> np.ndarray:
+        """Returns the data, or targets, of the items at the indices as an object array"""
+        if type(self).index is not ConcatRootflowDatasetView.index:
+            return super()._get_column_at(indices, targets)
+        in_dataset_one = indices < self.transition_point
+        column = np.empty(len(indices), dtype=object)
+        column[in_dataset_one] = self.dataset_one._get_column_at(
+            indices[in_dataset_one], targets
+        )
+        column[~in_dataset_one] = self.dataset_two._get_column_at(
+            indices[~in_dataset_one] - self.transition_point, targets
+        )
+        return self._transform_column(column, targets)
+
     def index(self, index):
         """Gets a single data example.
 
@@ -489,9 +607,9 @@ class ConcatRootflowDatasetView(FunctionalDataset):
             index -= self.transition_point
         id, data, target = selected_dataset.index(index)
         if self.has_data_transforms:
-            data = map_functions(data, self.data_transforms)
+            data = self._data_pipeline(data)
         if self.has_target_transforms:
-            target = map_functions(target, self.target_transforms)
+            target = self._target_pipeline(target)
         return (id, data, target)
 
 
@@ -548,3 +666,126 @@ class RootflowDataItem:
             >>> id, data, target = data_item
         """
         return iter((self.id, self.data, self.target))
+
+
+class _RootflowDataItemReference(RootflowDataItem):
+    """A data item stored in the columns of a :class:`RootflowDataset`.
+
+    Reads and writes its id, data and target directly from and to the columns of the
+    dataset, at a fixed position. Like any index into a list, the reference points to
+    a different item if items are inserted or removed before it.
+    """
+
+    __slots__ = ("_dataset", "_index")
+
+    def __init__(self, dataset: RootflowDataset, index: int) -> None:
+        self._dataset = dataset
+        self._index = index
+
+    @property
+    def id(self) -> Hashable:
+        return self._dataset._ids[self._index]
+
+    @id.setter
+    def id(self, id: Hashable) -> None:
+        self._dataset._ids[self._index] = id
+
+    @property
+    def data(self) -> Any:
+        return self._dataset._data[self._index]
+
+    @data.setter
+    def data(self, data: Any) -> None:
+        self._dataset._data[self._index] = data
+
+    @property
+    def target(self) -> Any:
+        return self._dataset._targets[self._index]
+
+    @target.setter
+    def target(self, target: Any) -> None:
+        self._dataset._targets[self._index] = target
+
+
+class RootflowDataItemSequence(MutableSequence):
+    """Item-wise access to the columns of a :class:`RootflowDataset`.
+
+    Exposes the column-wise storage of a dataset as a list-like sequence of
+    :class:`RootflowDataItem`s. Items are created when they are accessed, and read
+    and write their attributes from and to the dataset columns. Assigning, adding or
+    removing items edits the dataset columns in place.
+    """
+
+    def __init__(self, dataset: RootflowDataset) -> None:
+        """Creates a new sequence over the columns of a dataset.
+
+        Args:
+            dataset (RootflowDataset): The dataset whose columns we would like to
+                access.
+        """
+        self.dataset = dataset
+
+    def __len__(self) -> int:
+        """Returns the number of data items."""
+        return len(self.dataset._ids)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[RootflowDataItem, List[RootflowDataItem]]:
+        """Gets the data item(s) at the given index or slice."""
+        if isinstance(index, slice):
+            return [
+                _RootflowDataItemReference(self.dataset, idx)
+                for idx in range(len(self))[index]
+            ]
+        return _RootflowDataItemReference(self.dataset, range(len(self))[index])
+
+    def __setitem__(
+        self,
+        index: Union[int, slice],
+        data_item: Union[RootflowDataItem, Iterable[RootflowDataItem]],
+    ) -> None:
+        """Writes the data item(s) into the dataset columns at the index or slice."""
+        columns = (self.dataset._ids, self.dataset._data, self.dataset._targets)
+        if isinstance(index, slice):
+            column_values = list(zip(*data_item)) or [(), (), ()]
+            for column, values in zip(columns, column_values):
+                column[index] = values
+        else:
+            index = range(len(self))[index]
+            for column, value in zip(columns, tuple(data_item)):
+                column[index] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """Removes the data item(s) at the given index or slice."""
+        for column in (self.dataset._ids, self.dataset._data, self.dataset._targets):
+            del column[index]
+
+    def pop(self, index: int = -1) -> RootflowDataItem:
+        """Removes the data item at the given index and returns it."""
+        id, data, target = self[index]
+        del self[index]
+        data_item = RootflowDataItem(data, id=id)
+        data_item.target = target
+        return data_item
+
+    def insert(self, index: int, data_item: RootflowDataItem) -> None:
+        """Inserts a data item before the given index."""
+        id, data, target = data_item
+        self.dataset._ids.insert(index, id)
+        self.dataset._data.insert(index, data)
+        self.dataset._targets.insert(index, target)
+
+    def extend(self, data_items: Iterable[RootflowDataItem]) -> None:
+        """Appends all of the given data items to the end of the dataset."""
+        if data_items is self:
+            data_items = list(data_items)
+        for id, data, target in data_items:
+            self.dataset._ids.append(id)
+            self.dataset._data.append(data)
+            self.dataset._targets.append(target)
+
+    def __iter__(self) -> Iterator[RootflowDataItem]:
+        """Iterates over the data items."""
+        for index in range(len(self)):
+            yield _RootflowDataItemReference(self.dataset, index)
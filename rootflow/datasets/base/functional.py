@@ -6,11 +6,19 @@ dataset-like objects. (For example RootflowDatasetView)
 
 from typing import Callable, Sequence, Tuple, List, Union
 import os
-import random
+import numpy as np
+import torch
 from torch.utils.data import Dataset
 
 import rootflow.datasets.base.dataset as rootflow_datasets
-from rootflow.datasets.base.utils import get_nested_data_types
+from rootflow.datasets.base.loader import RootflowDataLoader
+from rootflow.datasets.base.utils import (
+    collate_values,
+    compose_functions,
+    get_nested_data_types,
+    prefetch_iterator,
+    to_object_array,
+)
 from rootflow.datasets.base.display_utils import (
     format_docstring,
     format_examples_tabular,
@@ -31,37 +39,48 @@ class FunctionalDataset(Dataset):
         self.target_transforms = []
         self.has_data_transforms = False
         self.has_target_transforms = False
+        self._data_pipeline = compose_functions(self.data_transforms)
+        self._target_pipeline = compose_functions(self.target_transforms)
+        self.prefetch_size = 0
 
     def __len__(self):
         """Returns the dataset length"""
         raise NotImplementedError
 
-    def __getitem__(self, index: Union[int, slice, tuple, list]):
+    def __getitem__(self, index: Union[int, slice, tuple, list, np.ndarray]):
         """Indexes dataset
 
         If the index specified is an integer, the dataset will call its index method,
         pack the result into a dictionary, and return it. However, if the index is
-        instead a slice or a list of integers, the dataset will return a view of itself
-        with the appropriate indices.
+        instead a slice, a list of integers, or a boolean mask array, the dataset will
+        return a view of itself with the appropriate indices.
 
         Args:
-            index Union[int, slice, tuple, list]: Specifies the portion of the dataset
-                to select.
+            index Union[int, slice, tuple, list, np.ndarray]: Specifies the portion of
+                the dataset to select.
 
         Returns:
             Union[dict, RootflowDatasetView]: Either a single data item, containing an
                 `"id"`, `"data"` and a `"target"`, or a :class:`RootflowDatasetView`
                 of the desired indices.
         """
-        if isinstance(index, int):
+        if isinstance(index, (int, np.integer)):
             id, data, target = self.index(index)
             return {"id": id, "data": data, "target": target}
         elif isinstance(index, slice):
-            data_indices = list(range(len(self))[index])
+            data_indices = np.arange(*index.indices(len(self)))
             return rootflow_datasets.RootflowDatasetView(
                 self, data_indices, sorted=False
             )
-        elif isinstance(index, (tuple, list)):
+        elif isinstance(index, np.ndarray) and index.dtype == bool:
+            if index.shape != (len(self),):
+                raise IndexError(
+                    f"Boolean mask of shape {index.shape} does not match dataset of length {len(self)}"
+                )
+            return rootflow_datasets.RootflowDatasetView(
+                self, np.flatnonzero(index), sorted=False
+            )
+        elif isinstance(index, (tuple, list, np.ndarray)):
             return rootflow_datasets.RootflowDatasetView(self, index)
 
     def __iter__(self):
@@ -69,19 +88,96 @@ class FunctionalDataset(Dataset):
 
         To avoid the additional overhead of checking types with :meth:`__getitem__`
         we call the dataset's :meth:`index` method for each index. The data is packed
-        into a dictionary, so that the outward facing API is consistent.
+        into a dictionary, so that the outward facing API is consistent. If
+        prefetching is enabled with :meth:`prefetch`, the items are loaded in a
+        background thread while the consumer works.
 
         Yields:
             dict: A dictionary containing an `"id"`, `"data"` and a `"target"`
         """
-        for index in range(len(self)):
-            id, data, target = self.index(index)
+        items = (self.index(index) for index in range(len(self)))
+        if self.prefetch_size > 0:
+            items = prefetch_iterator(items, self.prefetch_size)
+        for id, data, target in items:
             yield {"id": id, "data": data, "target": target}
 
+    def prefetch(
+        self, size: int = 8
+    ) -> Union[
+        "rootflow_datasets.RootflowDataset", "rootflow_datasets.RootflowDatasetView"
+    ]:
+        """Prefetches items when iterating over the dataset.
+
+        Sets how many items should be loaded ahead of the consumer, in a background
+        thread, when iterating over the dataset. This is useful when loading items is
+        slow, for example because of expensive transforms or reads from disk. Setting
+        the size to 0 disables prefetching. Returns `self` to support the functional
+        API.
+
+        Args:
+            size (:obj:`int`, optional): The number of items to load ahead.
+
+        Returns:
+            Union[RootflowDataset, RootflowDatasetView]: Returns `self`.
+        """
+        self.prefetch_size = size
+        return self
+
     def index(self, index: int) -> tuple:
         """Gets a data item at the index"""
         raise NotImplementedError
 
+    def collate(self, batch: List[dict]) -> dict:
+        """Collates a batch of dataset items.
+
+        Intended for use as the `collate_fn` of a :class:`DataLoader`. Numeric data and
+        targets are stacked into tensors with the batch as the first dimension, so
+        that `DataLoader(..., collate_fn=dataset.collate, pin_memory=True)` can copy
+        the whole batch into pinned memory, and from there to the GPU with
+        `non_blocking=True`. Data which can not be stacked (i.e. text) is kept as a
+        list, and the `"target"` key is omitted if the items have no targets.
+
+        Args:
+            batch (List[dict]): A list of items from the dataset.
+
+        Returns:
+            dict: A dictionary containing the batch's `"id"`s, `"data"` and
+                `"target"`s.
+        """
+        collated_batch = {}
+        for key in ("id", "data", "target"):
+            collated_values = collate_values([item[key] for item in batch])
+            if collated_values is not None:
+                collated_batch[key] = collated_values
+        return collated_batch
+
+    def as_dataloader(
+        self, batch_size: int = 1, shuffle: bool = False, **kwargs
+    ) -> RootflowDataLoader:
+        """Creates a data loader for the dataset.
+
+        Creates a :class:`RootflowDataLoader` with defaults suited to training, which
+        may be overridden with keyword arguments. By default the loader uses
+        `min(8, cpu_count // 2)` worker processes, which are kept alive between epochs
+        and each prefetch 4 batches, and pins memory if CUDA is available.
+
+        Args:
+            batch_size (:obj:`int`, optional): The number of items in each batch.
+            shuffle (:obj:`bool`, optional): Whether to shuffle the items each epoch.
+            **kwargs: Any additional arguments for :class:`RootflowDataLoader`.
+
+        Returns:
+            RootflowDataLoader: A data loader for the dataset.
+        """
+        kwargs.setdefault("num_workers", min(8, (os.cpu_count() or 1) // 2))
+        kwargs.setdefault("pin_memory", torch.cuda.is_available())
+        if kwargs["num_workers"] > 0:
+            kwargs.setdefault("persistent_workers", True)
+            kwargs.setdefault("prefetch_factor", 4)
+        return RootflowDataLoader(
+            self, batch_size=batch_size, shuffle=shuffle, **kwargs
+        )
+
     def split(
         self, validation_proportion: float = 0.1, seed: int = None
     ) -> Tuple[
@@ -102,8 +198,7 @@ class FunctionalDataset(Dataset):
                 respectively, the train set and the validation set.
         """
         dataset_length = len(self)
-        indices = list(range(dataset_length))
-        random.Random(seed).shuffle(indices)
+        indices = np.random.default_rng(seed).permutation(dataset_length)
         n_test = int(dataset_length * validation_proportion)
         return (
             rootflow_datasets.RootflowDatasetView(self, indices[n_test:], sorted=False),
@@ -115,6 +210,8 @@ class FunctionalDataset(Dataset):
         function: Union[Callable, List[Callable]],
         targets: bool = False,
         batch_size: int = None,
+        num_workers: int = 0,
+        use_threads: bool = False,
     ) -> Union[
         "rootflow_datasets.RootflowDataset", "rootflow_datasets.RootflowDatasetView"
     ]:
@@ -131,6 +228,10 @@ class FunctionalDataset(Dataset):
         Creates a new view from the dataset of every item for which the conditional
         statement is `True`. Does not modify the original dataset.
 
+        If `filter_function` has a truthy `vectorized` attribute, or is a numpy
+        ufunc, it is called only once, with an array of every item's data (or
+        targets), and should return a boolean mask over that array.
+
         Args:
             filter_function (Callable): A conditional function which returns `True`
                 for items you would like to have in the resulting, filtered, set.
@@ -140,18 +241,48 @@ class FunctionalDataset(Dataset):
         Returns:
             RootflowDatasetView: A view of the dataset which contains only dataset
                 items for which the filter_function was `True`
+
+        Raises:
+            ValueError: If a vectorized `filter_function` does not return a mask with
+                one value per item.
         """
-        if targets:
-            conditional_attr = "target"
+        column = self._get_column(targets)
+        if getattr(filter_function, "vectorized", False) or isinstance(
+            filter_function, np.ufunc
+        ):
+            mask = np.asarray(filter_function(column), dtype=bool)
+            if mask.shape != (len(column),):
+                raise ValueError(
+                    f"Vectorized filter returned a mask of shape {mask.shape} for dataset of length {len(column)}"
+                )
         else:
-            conditional_attr = "data"
-
-        filtered_indices = []
-        for index, item in enumerate(self):
-            if filter_function(item[conditional_attr]):
-                filtered_indices.append(index)
+            mask = np.fromiter(
+                map(filter_function, column), dtype=bool, count=len(column)
+            )
+        filtered_indices = np.nonzero(mask)[0]
         return rootflow_datasets.RootflowDatasetView(self, filtered_indices)
 
+    def _get_column(self, targets: bool = False) -> np.ndarray:
+        """Returns the data, or targets, of every item as an object array"""
+        return self._get_column_at(np.arange(len(self)), targets)
+
+    def _get_column_at(self, indices: np.ndarray, targets: bool = False) -> np.ndarray:
+        """Returns the data, or targets, of the items at the indices as an object array"""
+        position = 2 if targets else 1
+        return to_object_array(
+            (self.index(index)[position] for index in indices.tolist()), len(indices)
+        )
+
+    def _transform_column(
+        self, column: np.ndarray, targets: bool = False
+    ) -> np.ndarray:
+        """Applies our own data, or target, transforms to every value of a column"""
+        if targets and self.has_target_transforms:
+            return to_object_array(map(self._target_pipeline, column), len(column))
+        if not targets and self.has_data_transforms:
+            return to_object_array(map(self._data_pipeline, column), len(column))
+        return column
+
     # TODO if we wanted transform to be truly functional, we could just return
     # a new view, but that may be a costly abstraction
     def transform(
@@ -167,7 +298,10 @@ class FunctionalDataset(Dataset):
 
         :meth:`transform` returns self to better support a functional API. Keep in
         mind that it is not truly functional, and that the dataset is modified in
-        place for space, storage and speed concerns.
+        place for space, storage and speed concerns. The transforms are composed into
+        a single pipeline here, rather than each time an item is selected, so
+        transforms must always be added with :meth:`transform`. Editing the
+        `data_transforms` or `target_transforms` lists directly has no effect.
 
         Args:
             function (Union[Callable, List[Callable]]): The transform function or
@@ -183,9 +317,11 @@ class FunctionalDataset(Dataset):
         if targets:
             self.target_transforms += function
             self.has_target_transforms = True
+            self._target_pipeline = compose_functions(self.target_transforms)
         else:
             self.data_transforms += function
             self.has_data_transforms = True
+            self._data_pipeline = compose_functions(self.data_transforms)
         return self
 
     def __add__(
@@ -1,4 +1,5 @@
 from typing import Callable, Optional, Sequence
+from functools import partial
 
 from torch.utils.data import Dataset, DataLoader, Sampler
 from rootflow.datasets.base.utils import default_collate_without_key
@@ -28,8 +29,8 @@ class RootflowDataLoader(DataLoader):
         # instead of checking for None?
         if collate_fn is None:
             if dataset[0]["target"] is None:
-                collate_fn = lambda collate_inputs: default_collate_without_key(
-                    collate_inputs, "target"
+                collate_fn = partial(
+                    default_collate_without_key, key_to_remove="target"
                 )
         super().__init__(
             dataset,
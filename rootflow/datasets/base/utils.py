@@ -3,7 +3,20 @@
 Houses simple utility functions key to the behavior of rootflow datasets.
 """
 
-from typing import Any, Callable, Iterable, Mapping, Sequence, Union, Tuple, List
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Union,
+    Tuple,
+    List,
+)
+import queue
+import threading
+import numpy as np
 import torch
 from torch.utils.data.dataloader import default_collate
 
@@ -30,6 +43,42 @@ def default_collate_without_key(
     return default_collate(unprocessed_batch)
 
 
+def collate_values(values: list) -> Union[torch.Tensor, dict, list, None]:
+    """Collates a list of values into a single batch.
+
+    Numeric values, including sequences and arrays of numbers with the same shape,
+    are stacked into a single tensor, with the batch as the first dimension.
+    Mappings are collated key by key, and a list of all `None` values collates to
+    `None`. Any other values, such as strings or ragged sequences, are returned
+    unchanged as a list.
+
+    Args:
+        values (list): The values to collate, one from each item in the batch.
+
+    Returns:
+        Union[torch.Tensor, dict, list, None]: The collated batch.
+    """
+    if all(value is None for value in values):
+        return None
+    if all(isinstance(value, torch.Tensor) for value in values):
+        try:
+            return torch.stack(values)
+        except RuntimeError:
+            return values
+    if all(isinstance(value, Mapping) for value in values):
+        return {
+            key: collate_values([value[key] for value in values]) for key in values[0]
+        }
+
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        return values
+    if array.dtype.kind in "biuf":
+        return torch.from_numpy(array)
+    return values
+
+
 def batch(iterable: Iterable, batch_size: int = 1) -> list:
     """Batches an iterable.
 
@@ -70,6 +119,76 @@ def batch_enumerate(iterable: Iterable, batch_size: int = 1) -> Tuple[slice, lis
         yield (slice(ndx, upper), iterable[ndx:upper])
 
 
+def prefetch_iterator(iterable: Iterable, prefetch: int = 1) -> Iterator:
+    """Iterates in a background thread.
+
+    Consumes an iterable in a daemon thread, keeping up to `prefetch` items ready
+    ahead of the consumer. Exceptions raised while iterating are re-raised to the
+    consumer, and the background thread is stopped if the consumer stops early.
+
+    Args:
+        iterable (Iterable): The iterable to consume in the background.
+        prefetch (:obj:`int`, optional): The maximum number of items to have ready.
+
+    Yields:
+        Any: The items of the iterable, in order.
+    """
+    buffer = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+        except BaseException as error:
+            put((False, error))
+        else:
+            put((False, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            has_item, value = buffer.get()
+            if has_item:
+                yield value
+            elif value is None:
+                return
+            else:
+                raise value
+    finally:
+        stopped.set()
+
+
+def to_object_array(iterable: Iterable, length: int = -1) -> np.ndarray:
+    """Collects an iterable into a flat object array.
+
+    Builds a one dimensional numpy array of dtype `object`, with exactly one element
+    per item of the iterable. Unlike :func:`numpy.array`, nested sequences (such as
+    lists of features) are kept as single elements and are never broadcast into
+    additional dimensions.
+
+    Args:
+        iterable (Iterable): The items to collect.
+        length (:obj:`int`, optional): The number of items in the iterable, if known.
+            Providing the length allows the array to be allocated only once.
+
+    Returns:
+        np.ndarray: A one dimensional object array containing the items.
+    """
+    return np.fromiter(iterable, dtype=object, count=length)
+
+
 # TODO Using the term composition instead of map might be better and more mathematically accurate.
 def map_functions(obj: object, function_list: Iterable[Callable]) -> Any:
     """Maps multiple functions on an object.
@@ -90,6 +209,49 @@ def map_functions(obj: object, function_list: Iterable[Callable]) -> Any:
     return value
 
 
+def _identity(obj: object) -> object:
+    return obj
+
+
+class _Composition:
+    """Picklable composition of multiple functions"""
+
+    __slots__ = ("functions",)
+
+    def __init__(self, functions: Tuple[Callable, ...]) -> None:
+        self.functions = functions
+
+    def __call__(self, obj: object) -> Any:
+        value = obj
+        for function in self.functions:
+            value = function(value)
+        return value
+
+
+def compose_functions(function_list: Iterable[Callable]) -> Callable:
+    """Composes multiple functions into one.
+
+    Returns a single function equivalent to calling :func:`map_functions` with the
+    given functions. The composition is built once, so that applying it does not
+    need to walk the list of functions. An empty list composes to the identity, and
+    a single function is returned as is. The composition can be pickled whenever
+    the functions themselves can.
+
+    Args:
+        function_list (Iterable[Callable]): An ordered collection of functions to
+            compose.
+
+    Returns:
+        Callable: A function which applies each function in order to its input.
+    """
+    functions = tuple(function_list)
+    if len(functions) == 0:
+        return _identity
+    if len(functions) == 1:
+        return functions[0]
+    return _Composition(functions)
+
+
 def get_unique(input_iterator: Iterable, ordered: bool = True) -> list:
     """Returns unique elements.
 
@@ -118,6 +280,39 @@ def get_unique(input_iterator: Iterable, ordered: bool = True) -> list:
         return [item for item in input_iterator if not (item in seen or seen_add(item))]
 
 
+def get_unique_indices(indices: Iterable[int], ordered: bool = True) -> np.ndarray:
+    """Returns unique indices as an array.
+
+    Equivalent to :func:`get_unique` for integer indices, but computed with numpy
+    and returned as an int64 array, which is considerably faster and smaller for
+    large collections of indices. If the order is not sorted, indices will appear in
+    the order of their first appearance.
+
+    Args:
+        indices (Iterable[int]): The indices which you would like to reduce to only
+            the unique indices.
+        ordered (bool): A flag indicating wether the indices should be sorted.
+
+    Returns:
+        np.ndarray: The unique indices.
+
+    Raises:
+        TypeError: If the indices are not integers. (Boolean masks included)
+    """
+    if not isinstance(indices, (np.ndarray, Sequence)):
+        indices = list(indices)
+    indices = np.asarray(indices)
+    if indices.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if indices.dtype.kind not in "iu":
+        raise TypeError(f"Indices must be integers, not {indices.dtype}")
+    indices = indices.astype(np.int64, copy=False)
+    if ordered:
+        return np.unique(indices)
+    _, first_occurrences = np.unique(indices, return_index=True)
+    return indices[np.sort(first_occurrences)]
+
+
 def get_nested_data_types(object: Any) -> Union[dict, list, type]:
     """Returns the types of potentially nested structures.
 
@@ -82,8 +82,7 @@ class ExampleNLP(RootflowDataset):
 
     def setup(self):
         label_encoding = {"label-0": 0, "label-1": 1}
-        for idx, (id, data, label) in enumerate(self.data):
-            self.data[idx] = RootflowDataItem(data, id=id, target=label_encoding[label])
+        self.map(lambda label: label_encoding[label], targets=True)
 
     def download(self, path: str):
         ids = [f"example_dataset-{i}" for i in range(self.EXAMPLE_DATASET_LENGTH)]
@@ -78,16 +78,47 @@ def test_transform_concat_dataset_view():
     assert dataset.data[4].data == 4
 
 
+def test_transform_concat_dataset_view_of_transformed_datasets():
+    dataset = DatasetForTesting()
+    dataset_view = dataset[50:].transform(lambda x: x * 2)
+    concat_view = ConcatRootflowDatasetView(dataset, dataset_view)
+    concat_view.transform(lambda x: x + 1)
+    assert concat_view[1]["data"] == 2
+    assert concat_view[len(dataset) + 1]["data"] == 103
+    dataset.transform(lambda x: -x)
+    assert concat_view[1]["data"] == 0
+    assert concat_view[len(dataset) + 1]["data"] == -101
+
+    nested_concat_view = concat_view[98:102]
+    assert nested_concat_view[0]["data"] == -97
+    assert nested_concat_view[3]["data"] == -101
+
+
+def test_filter_concat_dataset_view_of_transformed_datasets():
+    dataset = DatasetForTesting()
+    dataset_view = dataset[50:].transform(lambda x: x * 2)
+    concat_view = ConcatRootflowDatasetView(dataset, dataset_view)
+    concat_view.transform(lambda x: x + 1)
+    filtered_view = concat_view.where(lambda x: x % 50 == 1)
+    assert [item["data"] for item in filtered_view] == [1, 51, 101, 151]
+    assert [item["id"] for item in filtered_view] == [
+        "data_item-0",
+        "data_item-50",
+        "data_item-50",
+        "data_item-75",
+    ]
+
+
 def test_split_concat_dataset_view():
     dataset = DatasetForTesting()
     dataset_view = ConcatRootflowDatasetView(dataset, dataset)
     split_one, split_two = dataset_view.split(seed=42)
-    assert split_one[3]["id"] == "data_item-26"
-    assert split_one[3]["data"] == 26
+    assert split_one[3]["id"] == "data_item-30"
+    assert split_one[3]["data"] == 30
     assert split_one[3]["target"] == False
-    assert split_two[3]["id"] == "data_item-93"
-    assert split_two[3]["data"] == 93
-    assert split_two[3]["target"] == False
+    assert split_two[3]["id"] == "data_item-46"
+    assert split_two[3]["data"] == 46
+    assert split_two[3]["target"] == True
     assert len(split_one) + len(split_two) == len(dataset_view)
 
 
@@ -126,7 +157,12 @@ def test_concat_concat_dataset_view_and_concat_dataset_view():
 
 
 def test_filter_concat_dataset_view():
-    raise NotImplementedError
+    dataset = DatasetForTesting()
+    concat_view = ConcatRootflowDatasetView(dataset[:10], dataset[90:])
+    filtered_view = concat_view.where(lambda x: x % 2 == 1)
+    assert len(filtered_view) == 10
+    assert filtered_view[5]["id"] == "data_item-91"
+    assert filtered_view[5]["data"] == 91
 
 
 def test_iter_concat_dataset_view():
@@ -1,4 +1,6 @@
 from typing import Tuple
+import pickle
+import numpy as np
 import pytest
 from rootflow.datasets.base.dataset import (
     RootflowDataset,
@@ -87,6 +89,27 @@ def test_slice_datset_with_list():
     assert dataset_view[6]["target"] == True
 
 
+def test_slice_dataset_with_array():
+    dataset = DatasetForTesting()
+
+    indices = np.array([7, 3, 6, 55, 12, 26, 31, 2])
+    dataset_view = dataset[indices]
+    assert dataset_view[6]["id"] == "data_item-31"
+    assert dataset_view[6]["data"] == 31
+    assert dataset_view[np.int64(0)]["id"] == "data_item-2"
+    assert dataset[np.int64(4)]["data"] == 4
+
+
+def test_slice_dataset_with_mask():
+    dataset = DatasetForTesting()
+    dataset_view = dataset[np.arange(100) >= 95]
+    assert len(dataset_view) == 5
+    assert dataset_view[0]["id"] == "data_item-95"
+    assert dataset_view[4]["id"] == "data_item-99"
+    with pytest.raises(IndexError):
+        dataset[np.ones(10, dtype=bool)]
+
+
 def test_map_dataset():
     dataset = DatasetForTesting()
     map_function = lambda x: ((x**2) + 1) / 10
@@ -95,6 +118,121 @@ def test_map_dataset():
     assert mapped_dataset.data[4].data == 1.7
 
 
+def test_map_dataset_batched():
+    dataset = DatasetForTesting()
+    map_function = lambda batch: [[x, x + 1] for x in batch]
+    mapped_dataset = dataset.map(map_function, batch_size=8)
+    assert mapped_dataset[4]["data"] == [4, 5]
+    assert mapped_dataset[99]["data"] == [99, 100]
+    assert mapped_dataset.data[4].data == [4, 5]
+
+
+def test_map_dataset_targets():
+    dataset = DatasetForTesting()
+    mapped_dataset = dataset.map(lambda x: int(x), targets=True)
+    assert mapped_dataset[4]["target"] == 1
+    assert mapped_dataset[4]["data"] == 4
+
+
+def test_map_dataset_parallel():
+    dataset = DatasetForTesting()
+    mapped_dataset = dataset.map(str, num_workers=2)
+    assert mapped_dataset[4]["data"] == "4"
+    assert mapped_dataset[99]["data"] == "99"
+
+    dataset = DatasetForTesting()
+    map_function = lambda batch: [[x, x + 1] for x in batch]
+    mapped_dataset = dataset.map(
+        map_function, batch_size=8, num_workers=3, use_threads=True
+    )
+    assert mapped_dataset[4]["data"] == [4, 5]
+    assert mapped_dataset[99]["data"] == [99, 100]
+
+    dataset = DatasetForTesting()
+    with pytest.raises(AssertionError):
+        dataset.map(
+            lambda batch: batch[1:], batch_size=8, num_workers=2, use_threads=True
+        )
+    assert dataset[4]["data"] == 4
+
+
+def test_set_dataset_data_items():
+    dataset = DatasetForTesting()
+    dataset.data[3] = RootflowDataItem("new data", id="new-item", target=True)
+    assert dataset[3]["id"] == "new-item"
+    assert dataset[3]["data"] == "new data"
+    assert dataset[3]["target"] == True
+    assert len(dataset.data) == len(dataset)
+    assert [item.data for item in dataset.data[:3]] == [0, 1, 2]
+
+
+def test_set_dataset_data_item_attributes():
+    class DoubledDatasetForTesting(DatasetForTesting):
+        def setup(self):
+            for item in self.data:
+                item.data *= 2
+
+    dataset = DoubledDatasetForTesting()
+    assert dataset[4]["data"] == 8
+    dataset.data[4].target = "new target"
+    assert dataset[4]["target"] == "new target"
+    dataset.data[-1].id = "last"
+    assert dataset[99]["id"] == "last"
+
+
+def test_set_dataset_data_items_slice():
+    dataset = DatasetForTesting()
+    dataset.data[0:2] = [
+        RootflowDataItem("a", id="new-a", target=True),
+        RootflowDataItem("b", id="new-b", target=False),
+    ]
+    assert dataset[0]["id"] == "new-a"
+    assert dataset[1]["data"] == "b"
+    assert dataset[2]["data"] == 2
+    assert len(dataset) == 100
+
+    dataset.data[0:2] = dataset.data[2:5]
+    assert [item.data for item in dataset.data[:5]] == [2, 3, 4, 2, 3]
+    assert len(dataset) == 101
+
+    dataset.data[:3] = []
+    assert len(dataset) == 98
+    with pytest.raises(ValueError):
+        dataset.data[::2] = [RootflowDataItem("c")]
+    assert len(dataset) == 98
+
+
+def test_edit_dataset_data_items():
+    class GrowingDatasetForTesting(DatasetForTesting):
+        def setup(self):
+            self.data.append(RootflowDataItem(100, id="data_item-100", target=True))
+
+    dataset = GrowingDatasetForTesting()
+    assert len(dataset) == 101
+    assert dataset[100]["id"] == "data_item-100"
+
+    dataset.data.extend(
+        RootflowDataItem(i, id=f"data_item-{i}", target=False) for i in range(101, 103)
+    )
+    dataset.data.insert(0, RootflowDataItem(-1, id="data_item--1", target=False))
+    assert len(dataset) == 104
+    assert dataset[0]["data"] == -1
+    assert dataset[1]["data"] == 0
+    assert dataset[103]["data"] == 102
+
+    del dataset.data[0]
+    del dataset.data[-3:]
+    assert len(dataset) == 100
+    assert [item.data for item in dataset.data] == list(range(100))
+    with pytest.raises(IndexError):
+        del dataset.data[100]
+
+    dataset.data += [RootflowDataItem("last", id="last", target=None)]
+    assert len(dataset) == 101
+    assert dataset.data.pop().id == "last"
+    assert len(dataset) == 100
+
+
 def test_transform_dataset():
     dataset = DatasetForTesting()
     transform_function = lambda x: ((x**2) + 1) / 10
@@ -103,14 +241,34 @@ def test_transform_dataset():
     assert transformed_dataset.data[4].data == 4
 
 
+def test_transform_dataset_multiple():
+    dataset = DatasetForTesting()
+    dataset.transform([lambda x: x + 1, lambda x: x * 2])
+    dataset.transform(lambda x: x - 3)
+    dataset.transform(lambda x: not x, targets=True)
+    assert dataset[4]["data"] == 7
+    assert dataset[4]["target"] == False
+    assert dataset.data[4].data == 4
+
+
+def test_pickle_transformed_dataset():
+    dataset = DatasetForTesting()
+    dataset.transform([abs, str, len])
+    dataset_view = dataset[10:20].transform(float)
+    assert dataset_view[0]["data"] == 2.0
+    unpickled_view = pickle.loads(pickle.dumps(dataset_view))
+    assert unpickled_view[0]["data"] == 2.0
+    assert pickle.loads(pickle.dumps(dataset))[5]["data"] == 1
+
+
 def test_split_dataset():
     dataset = DatasetForTesting()
     split_one, split_two = dataset.split(seed=42)
-    assert split_one[3]["id"] == "data_item-56"
-    assert split_one[3]["data"] == 56
-    assert split_one[3]["target"] == False
-    assert split_two[8]["id"] == "data_item-15"
-    assert split_two[8]["data"] == 15
+    assert split_one[3]["id"] == "data_item-52"
+    assert split_one[3]["data"] == 52
+    assert split_one[3]["target"] == True
+    assert split_two[8]["id"] == "data_item-92"
+    assert split_two[8]["data"] == 92
     assert split_two[8]["target"] == False
     assert len(split_one) + len(split_two) == len(dataset)
 
@@ -145,13 +303,193 @@ def test_concat_dataset_and_concat_dataset_view():
 
 
 def test_filter_dataset():
-    raise NotImplementedError
+    dataset = DatasetForTesting()
+    filtered_dataset = dataset.where(lambda x: x % 10 == 3)
+    assert len(filtered_dataset) == 10
+    assert filtered_dataset[2]["id"] == "data_item-23"
+    assert filtered_dataset[2]["data"] == 23
+
+    filtered_dataset = dataset.where(lambda x: x, targets=True)
+    assert len(filtered_dataset) == 33
+    assert filtered_dataset[0]["data"] == 1
+
+    dataset.transform(lambda x: x * 2)
+    filtered_dataset = dataset.where(lambda x: x < 10)
+    assert len(filtered_dataset) == 5
+    assert filtered_dataset[4]["data"] == 8
+
+
+def test_filter_dataset_overridden_index():
+    class ScaledDatasetForTesting(DatasetForTesting):
+        def index(self, index):
+            id, data, target = super().index(index)
+            return (id, data * 1000, target)
+
+    dataset = ScaledDatasetForTesting()
+    filtered_dataset = dataset.where(lambda x: x >= 1000)
+    assert len(filtered_dataset) == 99
+    assert filtered_dataset[0]["data"] == 1000
+    filtered_dataset = dataset[:10].where(lambda x: x >= 5000)
+    assert len(filtered_dataset) == 5
+
+
+def test_filter_dataset_view_transform_calls():
+    dataset = DatasetForTesting()
+    calls = []
+
+    def transform_function(x):
+        calls.append(x)
+        return x + 1
+
+    dataset.transform(transform_function)
+    filtered_dataset = dataset[:10].where(lambda x: x > 5)
+    assert len(calls) == 10
+    assert len(filtered_dataset) == 5
+
+
+def test_filter_dataset_vectorized_unmodified():
+    dataset = DatasetForTesting()
+
+    def filter_function(data):
+        data[0] = 100
+        return data > 5
+
+    filter_function.vectorized = True
+    filtered_dataset = dataset.where(filter_function)
+    assert len(filtered_dataset) == 95
+    assert dataset[0]["data"] == 0
+
+
+def test_filter_dataset_vectorized():
+    dataset = DatasetForTesting()
+    filter_function = lambda data: data >= 90
+    filter_function.vectorized = True
+    filtered_dataset = dataset.where(filter_function)
+    assert len(filtered_dataset) == 10
+    assert filtered_dataset[0]["data"] == 90
+
+    filtered_dataset = dataset.where(np.logical_not, targets=True)
+    assert len(filtered_dataset) == 67
+    assert filtered_dataset[1]["data"] == 2
+
+
+def test_filter_dataset_vectorized_wrong_shape():
+    dataset = DatasetForTesting()
+    for mask in ([True, False], [True] * 105, True):
+        filter_function = lambda data: mask
+        filter_function.vectorized = True
+        with pytest.raises(ValueError):
+            dataset.where(filter_function)
 
 
 def test_iter_dataset():
     raise NotImplementedError
 
 
+def test_iter_dataset_prefetch():
+    dataset = DatasetForTesting().prefetch(4)
+    items = list(dataset)
+    assert len(items) == len(dataset)
+    assert items[10]["id"] == "data_item-10"
+    assert items[10]["data"] == 10
+    assert items[10]["target"] == True
+
+
+def test_collate_dataset():
+    dataset = DatasetForTesting()
+    batch = dataset.collate([dataset[i] for i in range(4)])
+    assert batch["id"] == [f"data_item-{i}" for i in range(4)]
+    assert batch["data"].tolist() == [0, 1, 2, 3]
+    assert batch["target"].tolist() == [False, True, False, False]
+
+    dataset.transform(lambda x: [x, x * 2])
+    batch = dataset.collate([dataset[i] for i in range(4)])
+    assert batch["data"].shape == (4, 2)
+
+
+def test_dataset_as_dataloader():
+    dataset = DatasetForTesting()
+    dataloader = dataset.as_dataloader(batch_size=10, num_workers=2)
+    assert dataloader.num_workers == 2
+    assert dataloader.persistent_workers == True
+    assert dataloader.prefetch_factor == 4
+    batches = list(dataloader)
+    assert len(batches) == 10
+    assert batches[0]["data"].tolist() == list(range(10))
+    assert batches[9]["id"][0] == "data_item-90"
+
+
+def double_data(x):
+    return x * 2
+
+
+def increment_data(x):
+    return x + 1
+
+
+class UnlabeledDatasetForTesting(RootflowDataset):
+    def prepare_data(self, path: str):
+        return [RootflowDataItem(i, id=f"data_item-{i}") for i in range(100)]
+
+
+def test_dataset_as_dataloader_spawn():
+    dataset = DatasetForTesting()
+    dataset.transform([double_data, increment_data])
+    dataset_view = dataset[::2].transform(increment_data)
+    dataloader = dataset_view.as_dataloader(
+        batch_size=10, num_workers=2, multiprocessing_context="spawn"
+    )
+    batches = list(dataloader)
+    assert len(batches) == 5
+    assert batches[0]["data"].tolist() == [4 * i + 2 for i in range(10)]
+
+    dataloader = UnlabeledDatasetForTesting().as_dataloader(
+        batch_size=10, num_workers=2, multiprocessing_context="spawn"
+    )
+    batches = list(dataloader)
+    assert len(batches) == 10
+    assert "target" not in batches[0]
+
+
+def test_infer_tasks_dataset():
+    class DatasetForTesting(RootflowDataset):
+        def prepare_data(self, path: str):
+            return [
+                RootflowDataItem(i, target={"mod_four": i % 4, "value": float(i)})
+                for i in range(100)
+            ]
+
+    dataset = DatasetForTesting()
+    assert dataset.tasks() == [
+        {"name": "mod_four", "type": "classification", "shape": 3},
+        {"name": "value", "type": "regression", "shape": 1},
+    ]
+
+    class DatasetForTesting(RootflowDataset):
+        def prepare_data(self, path: str):
+            return [RootflowDataItem(i, target=i % 2) for i in range(100)]
+
+        def setup(self):
+            self.transform(lambda target: target * 5, targets=True)
+
+    dataset = DatasetForTesting()
+    assert dataset.tasks() == [{"name": "task", "type": "classification", "shape": 5}]
+
+
+def test_infer_tasks_dataset_overridden_index():
+    class DatasetForTesting(RootflowDataset):
+        def prepare_data(self, path: str):
+            return [RootflowDataItem(i, target=i % 2) for i in range(100)]
+
+        def index(self, index):
+            id, data, target = super().index(index)
+            return (id, data, target * 7)
+
+    dataset = DatasetForTesting()
+    assert dataset[1]["target"] == 7
+    assert dataset.tasks() == [{"name": "task", "type": "classification", "shape": 7}]
+
+
 def test_get_tasks_dataset():
     raise NotImplementedError
 
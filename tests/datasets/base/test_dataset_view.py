@@ -87,15 +87,43 @@ def test_transform_dataset_view():
     assert dataset.data[4].data == 4
 
 
+def test_transform_nested_dataset_view():
+    dataset = DatasetForTesting()
+    dataset_view = dataset[10:50][5:]
+    dataset_view.transform(lambda x: x * 2)
+    assert dataset_view[0]["data"] == 30
+    dataset.transform(lambda x: x + 1)
+    assert dataset_view[0]["data"] == 32
+    dataset_view.transform(lambda x: not x, targets=True)
+    assert dataset_view[0]["target"] == True
+    assert dataset[15]["data"] == 16
+    assert dataset[15]["target"] == False
+
+
+def test_dataset_view_of_overridden_index():
+    class DecodedDatasetForTesting(DatasetForTesting):
+        def index(self, index):
+            id, data, target = super().index(index)
+            return (id, f"decoded-{data}", target)
+
+    dataset = DecodedDatasetForTesting()
+    assert dataset[3]["data"] == "decoded-3"
+    assert dataset[2:5][1]["data"] == "decoded-3"
+    assert (dataset + dataset)[3]["data"] == "decoded-3"
+    dataset_view = dataset[2:5].transform(lambda x: x.upper())
+    assert dataset_view[1]["data"] == "DECODED-3"
+    assert (dataset_view + dataset)[1]["data"] == "DECODED-3"
+
+
 def test_split_dataset_view():
     dataset = DatasetForTesting()
     dataset_view = dataset[2:88]
     split_one, split_two = dataset_view.split(seed=42)
-    assert split_one[3]["id"] == "data_item-61"
-    assert split_one[3]["data"] == 61
-    assert split_one[3]["target"] == True
-    assert split_two[3]["id"] == "data_item-32"
-    assert split_two[3]["data"] == 32
+    assert split_one[3]["id"] == "data_item-44"
+    assert split_one[3]["data"] == 44
+    assert split_one[3]["target"] == False
+    assert split_two[3]["id"] == "data_item-63"
+    assert split_two[3]["data"] == 63
     assert split_two[3]["target"] == False
     assert len(split_one) + len(split_two) == len(dataset_view)
 
@@ -133,7 +161,17 @@ def test_dataset_view_and_concat_dataset_view():
 
 
 def test_filter_dataset_view():
-    raise NotImplementedError
+    dataset = DatasetForTesting()
+    dataset_view = dataset[50:]
+    filtered_view = dataset_view.where(lambda x: x % 10 == 3)
+    assert len(filtered_view) == 5
+    assert filtered_view[0]["id"] == "data_item-53"
+    assert filtered_view[0]["data"] == 53
+
+    dataset_view.transform(lambda x: x - 50)
+    filtered_view = dataset_view.where(lambda x: x < 3)
+    assert len(filtered_view) == 3
+    assert filtered_view[2]["id"] == "data_item-52"
 
 
 def test_iter_dataset_veiw():
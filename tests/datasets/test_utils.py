@@ -1,6 +1,28 @@
+import pickle
+import numpy as np
+import pytest
+import torch
 from rootflow.datasets.base.utils import *
 
 
+def test_collate_values():
+    collated = collate_values([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    assert isinstance(collated, torch.Tensor)
+    assert collated.shape == (3, 2)
+    assert collated[1].tolist() == [3.0, 4.0]
+
+    collated = collate_values([torch.zeros(4), torch.ones(4)])
+    assert collated.shape == (2, 4)
+
+    collated = collate_values([{"task": 1, "name": "a"}, {"task": 0, "name": "b"}])
+    assert collated["task"].tolist() == [1, 0]
+    assert collated["name"] == ["a", "b"]
+
+    assert collate_values(["some", "text"]) == ["some", "text"]
+    assert collate_values([[1, 2], [3]]) == [[1, 2], [3]]
+    assert collate_values([None, None]) is None
+
+
 def test_batch():
     my_list = [i for i in range(100)]
     for _batch in batch(my_list, batch_size=5):
@@ -28,6 +50,36 @@ def test_batch_enumerate():
         assert (len(_batch) == 7) or (len(_batch) == 2)
 
 
+def test_prefetch_iterator():
+    assert list(prefetch_iterator(range(100), prefetch=4)) == list(range(100))
+    assert list(prefetch_iterator([], prefetch=4)) == []
+
+    def failing_generator():
+        yield 1
+        raise ValueError("failed")
+
+    iterator = prefetch_iterator(failing_generator())
+    assert next(iterator) == 1
+    with pytest.raises(ValueError):
+        next(iterator)
+
+    iterator = prefetch_iterator(range(100), prefetch=2)
+    assert next(iterator) == 0
+    iterator.close()
+
+
+def test_to_object_array():
+    items = [[1, 2], [3, 4], "string", {"key": 5}]
+    array = to_object_array(items, len(items))
+    assert array.shape == (4,)
+    assert array[0] == [1, 2]
+    assert array[2] == "string"
+    assert array[3] == {"key": 5}
+    array = to_object_array(iter([(1, 2), (3, 4)]))
+    assert array.shape == (2,)
+    assert array[1] == (3, 4)
+
+
 def test_map_functions():
     functions = [
         lambda x: x + 1,
@@ -51,6 +103,29 @@ def test_map_functions():
     assert map_functions("4tun3", functions) == "4tun34tun3."
 
 
+def test_compose_functions():
+    functions = [
+        lambda x: x + 1,
+        lambda x: x**2,
+        lambda x: str(x),
+        lambda x: f"1{x}",
+        lambda x: int(x),
+        lambda x: x / 8,
+    ]
+    composition = compose_functions(functions)
+    assert composition(5) == 17.0
+    assert composition(13) == 149.5
+
+    assert compose_functions([])("unchanged") == "unchanged"
+    assert compose_functions(functions[:1]) is functions[0]
+
+
+def test_compose_functions_pickle():
+    composition = compose_functions([abs, str, len])
+    unpickled_composition = pickle.loads(pickle.dumps(composition))
+    assert unpickled_composition(-125) == 3
+
+
 def test_get_unique_ordered():
     my_list = [0, 5, 2, 6, 1, 7, 8, 2]
     assert get_unique(my_list) == [0, 1, 2, 5, 6, 7, 8]
@@ -73,6 +148,23 @@ def test_get_unique_unordered():
     assert get_unique(my_list, ordered=False) == [1, 2, 3, 4, 5]
 
 
+def test_get_unique_indices():
+    my_list = [8, 5, 7, 2, 1, 8, 5, 1, 2, 6, 8, 9, 5]
+    unique_indices = get_unique_indices(my_list)
+    assert unique_indices.dtype == np.int64
+    assert unique_indices.tolist() == [1, 2, 5, 6, 7, 8, 9]
+    unique_indices = get_unique_indices(my_list, ordered=False)
+    assert unique_indices.tolist() == [8, 5, 7, 2, 1, 6, 9]
+    unique_indices = get_unique_indices(np.array([3, 3, 0]), ordered=False)
+    assert unique_indices.tolist() == [3, 0]
+    assert get_unique_indices([]).tolist() == []
+    assert get_unique_indices(range(3)).tolist() == [0, 1, 2]
+    with pytest.raises(TypeError):
+        get_unique_indices(np.array([True, False]))
+    with pytest.raises(TypeError):
+        get_unique_indices([1.0, 2.0])
+
+
 def test_predict_task():
     # Remember to test inputs for tensor types
     # Test for single element lists as well